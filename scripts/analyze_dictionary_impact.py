@@ -1,52 +1,4 @@
-def count_letter_differences(word1, word2):
-    """Count how many letters are different between two words"""
-    if len(word1) != len(word2):
-        return float('inf')
-    
-    # Count letters in each word
-    from collections import Counter
-    counter1 = Counter(word1.lower())
-    counter2 = Counter(word2.lower())
-    
-    # Calculate the difference
-    diff = 0
-    all_letters = set(counter1.keys()) | set(counter2.keys())
-    for letter in all_letters:
-        diff += abs(counter1.get(letter, 0) - counter2.get(letter, 0))
-    
-    return diff // 2  # Each substitution counts as 2 in the difference
-
-def is_valid_move(word1, word2, valid_words):
-    """Check if moving from word1 to word2 is valid (differs by exactly 1 letter)"""
-    if word2.lower() not in valid_words:
-        return False
-    return count_letter_differences(word1, word2) == 1
-
-def find_shortest_path(start, target, valid_words):
-    """Find shortest path using BFS with rearrangement rules"""
-    from collections import deque
-    
-    start, target = start.lower(), target.lower()
-    if start == target:
-        return [start.upper()]
-    
-    queue = deque([(start, [start])])
-    visited = {start}
-    
-    while queue:
-        current, path = queue.popleft()
-        
-        # Try all valid words as next steps
-        for word in valid_words:
-            if word not in visited and is_valid_move(current, word, valid_words):
-                new_path = path + [word]
-                if word == target:
-                    return [w.upper() for w in new_path]
-                
-                visited.add(word)
-                queue.append((word, new_path))
-    
-    return None  # No path found
+from dictionary_snapshots import DictionarySnapshotStore
 
 # Original smaller dictionary (before expansion)
 original_words = {
@@ -115,25 +67,28 @@ test_pairs = [
     ("MAGIC", "ROBOT")
 ]
 
+# The expanded dictionary is stored as a delta, so both versions share one base graph
+store = DictionarySnapshotStore(original_words)
+store.record_delta("expanded", added={
+    "birch", "cedar", "maple", "trees", "beach", "ocean", "river", "lakes",
+    "chair", "table", "house", "rooms", "doors", "walls", "floor", "glass",
+    "bread", "fruit", "grape", "peach", "berry", "cream", "sugar", "honey",
+    "tiger", "bears", "birds", "sheep", "goats", "horse", "mouse", "snake"
+})
+original_graph = store.graph(None)
+expanded_graph = store.graph("expanded")
+
 print("=== DICTIONARY EXPANSION IMPACT ANALYSIS ===\n")
 
 for start, target in test_pairs:
     print(f"Testing path: {start} → {target}")
     
     # Find path with original dictionary
-    original_path = find_shortest_path(start, target, original_words)
+    original_path = original_graph.shortest_path(start, target)
     original_steps = len(original_path) - 1 if original_path else "No path"
     
-    # Find path with expanded dictionary (simulating the expanded set)
-    # For this analysis, I'll add some common words that might create shortcuts
-    expanded_words = original_words | {
-        "birch", "cedar", "maple", "trees", "beach", "ocean", "river", "lakes",
-        "chair", "table", "house", "rooms", "doors", "walls", "floor", "glass",
-        "bread", "fruit", "grape", "peach", "berry", "cream", "sugar", "honey",
-        "tiger", "bears", "birds", "sheep", "goats", "horse", "mouse", "snake"
-    }
-    
-    expanded_path = find_shortest_path(start, target, expanded_words)
+    # Find path with expanded dictionary
+    expanded_path = expanded_graph.shortest_path(start, target)
     expanded_steps = len(expanded_path) - 1 if expanded_path else "No path"
     
     print(f"  Original dictionary: {original_steps} steps")
@@ -0,0 +1,246 @@
+import argparse
+import gzip
+import json
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from build_neighbor_index import ROOT_DIR, load_words
+from packed_words import PackedGraph, WordTable
+
+PUZZLES_FILE = os.path.join(ROOT_DIR, "data", "puzzles-2025.json")
+
+CHUNK_LINES = 5000
+TOP_DEAD_ENDS = 10
+
+# Log records are one JSON object per line, using the game's own state names:
+#   {"date": "2025-09-01", "attempts": ["LADEN", ...], "hintShownForRow": 2, "gameWon": true}
+# "root" and "mystery" may be included; otherwise they come from the puzzle schedule.
+# hintShownForRow is the attempt index at which the clue was shown, -1 for none.
+
+# Per-process state, set up once by init_worker
+_graph = None
+_puzzles = None
+_distances = {}
+
+
+def init_worker(puzzles_file):
+    global _graph, _puzzles, _distances
+    _graph = PackedGraph(WordTable(load_words()))
+    with open(puzzles_file) as f:
+        _puzzles = {row["date"]: (row["root"].upper(), row["mystery"].upper()) for row in json.load(f)}
+    _distances = {}
+
+
+def distances_to(mystery):
+    """Distance from every word id to the mystery word, cached per puzzle"""
+    distance = _distances.get(mystery)
+    if distance is None:
+        # Moves are symmetric, so distances from the mystery are distances to it
+        distance = _distances[mystery] = _graph.distances_from(mystery)
+    return distance
+
+
+def empty_stats(root, mystery, optimal):
+    return {
+        "root": root,
+        "mystery": mystery,
+        "optimal": optimal,
+        "plays": 0,
+        "wins": 0,
+        "moves": 0,
+        "excess_moves": 0,
+        "optimal_solves": 0,
+        "off_route_moves": 0,
+        "unknown_words": 0,
+        "dead_ends": Counter(),
+        "hint_plays": 0,
+        "hint_rows": Counter(),
+        "hint_remaining": Counter(),
+    }
+
+
+def score_record(record, stats_by_date):
+    """Replay one game against the distance-to-mystery table and add it to its date's stats"""
+    date = record["date"]
+    root, mystery = _puzzles.get(date, (None, None))
+    root = str(record.get("root") or root or "").upper()
+    mystery = str(record.get("mystery") or mystery or "").upper()
+    root_id = _graph.table.id_of(root)
+    if root_id is None or _graph.table.id_of(mystery) is None:
+        return False
+
+    distance = distances_to(mystery)
+    stats = stats_by_date.get(date)
+    if stats is None:
+        stats = stats_by_date[date] = empty_stats(root, mystery, distance[root_id])
+
+    attempts = [str(word).upper() for word in record.get("attempts", [])]
+    hint_row = record.get("hintShownForRow", -1)
+    won = bool(record.get("gameWon")) or (attempts[-1:] == [mystery])
+
+    stats["plays"] += 1
+    stats["moves"] += len(attempts)
+
+    previous = distance[root_id]
+    for row, word in enumerate(attempts):
+        if row == hint_row:
+            stats["hint_plays"] += 1
+            stats["hint_rows"][row] += 1
+            stats["hint_remaining"][previous] += 1
+        word_id = _graph.table.id_of(word)
+        if word_id is None:
+            stats["unknown_words"] += 1
+            continue
+        current = distance[word_id]
+        # A dead end is a move that did not bring the player any closer to the mystery word
+        if current == -1 or previous == -1 or current >= previous:
+            stats["off_route_moves"] += 1
+            stats["dead_ends"][word] += 1
+        previous = current
+
+    if won:
+        excess = len(attempts) - stats["optimal"]
+        stats["wins"] += 1
+        stats["excess_moves"] += excess
+        if excess == 0:
+            stats["optimal_solves"] += 1
+    return True
+
+
+def process_chunk(lines):
+    """Aggregate one chunk of NDJSON lines; returns (stats by date, bad line count)"""
+    stats_by_date = {}
+    bad_lines = 0
+    for line in lines:
+        try:
+            record = json.loads(line)
+            if not score_record(record, stats_by_date):
+                bad_lines += 1
+        except (ValueError, KeyError, TypeError, AttributeError):
+            bad_lines += 1
+    return stats_by_date, bad_lines
+
+
+def merge_stats(total, part):
+    """Fold one chunk's per-date stats into the running totals.
+
+    Totals grow with the number of dates and dictionary words, never with the number of games.
+    """
+    for date, stats in part.items():
+        current = total.get(date)
+        if current is None:
+            total[date] = stats
+            continue
+        for key, value in stats.items():
+            if isinstance(value, Counter):
+                current[key].update(value)
+            elif key not in ("root", "mystery", "optimal"):
+                current[key] += value
+
+
+def open_log(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def read_chunks(paths, chunk_lines):
+    """Yield lists of non-empty lines from each log in turn"""
+    for path in paths:
+        with open_log(path) as f:
+            chunk = []
+            for line in f:
+                if line.strip():
+                    chunk.append(line)
+                    if len(chunk) >= chunk_lines:
+                        yield chunk
+                        chunk = []
+            if chunk:
+                yield chunk
+
+
+def analyze(paths, puzzles_file=PUZZLES_FILE, chunk_lines=CHUNK_LINES, workers=1):
+    """Stream logs through a process pool, keeping at most two chunks in flight per worker"""
+    total = {}
+    bad_lines = 0
+    chunks = read_chunks(paths, chunk_lines)
+
+    if workers <= 1:
+        init_worker(puzzles_file)
+        for chunk in chunks:
+            part, bad = process_chunk(chunk)
+            merge_stats(total, part)
+            bad_lines += bad
+        return total, bad_lines
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(puzzles_file,)) as executor:
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(process_chunk, chunk))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    part, bad = future.result()
+                    merge_stats(total, part)
+                    bad_lines += bad
+        for future in pending:
+            part, bad = future.result()
+            merge_stats(total, part)
+            bad_lines += bad
+    return total, bad_lines
+
+
+def summarize(stats):
+    """Per-date summary suitable for JSON output and for puzzle selection"""
+    wins = stats["wins"]
+    return {
+        "root": stats["root"],
+        "mystery": stats["mystery"],
+        "optimal": stats["optimal"],
+        "plays": stats["plays"],
+        "wins": wins,
+        "win_rate": round(wins / stats["plays"], 4) if stats["plays"] else 0.0,
+        "mean_excess_moves": round(stats["excess_moves"] / wins, 4) if wins else None,
+        "optimal_solves": stats["optimal_solves"],
+        "off_route_moves": stats["off_route_moves"],
+        "unknown_words": stats["unknown_words"],
+        "dead_ends": dict(sorted(stats["dead_ends"].items(), key=lambda item: (-item[1], item[0]))[:TOP_DEAD_ENDS]),
+        "hint_plays": stats["hint_plays"],
+        "hint_rows": {str(k): v for k, v in sorted(stats["hint_rows"].items())},
+        "hint_remaining": {str(k): v for k, v in sorted(stats["hint_remaining"].items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare logged player attempts with optimal routes")
+    parser.add_argument("logs", nargs="+", help="NDJSON attempt logs (.gz is read compressed)")
+    parser.add_argument("--puzzles", default=PUZZLES_FILE, help="puzzle schedule used to look up dates")
+    parser.add_argument("--chunk-lines", type=int, default=CHUNK_LINES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", help="write per-date stats JSON here (see plan_puzzle_schedule.py)")
+    args = parser.parse_args()
+
+    total, bad_lines = analyze(args.logs, args.puzzles, args.chunk_lines, args.workers)
+    summaries = {date: summarize(total[date]) for date in sorted(total)}
+
+    print("=== PLAYER LOG ANALYSIS ===\n")
+    print(f"Games: {sum(s['plays'] for s in summaries.values())} over {len(summaries)} dates")
+    print(f"Skipped lines: {bad_lines}\n")
+    print(f"{'Date':<12}{'Puzzle':<15}{'Opt':>4}{'Plays':>7}{'Win%':>7}{'Excess':>8}{'Hints':>7}  Top dead end")
+    for date, s in summaries.items():
+        excess = f"{s['mean_excess_moves']:.2f}" if s["mean_excess_moves"] is not None else "-"
+        dead_end = next(iter(s["dead_ends"]), "-")
+        print(f"{date:<12}{s['root'] + '→' + s['mystery']:<15}{s['optimal']:>4}{s['plays']:>7}"
+              f"{s['win_rate'] * 100:>6.1f}%{excess:>8}{s['hint_plays']:>7}  {dead_end}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"dates": summaries}, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote stats to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
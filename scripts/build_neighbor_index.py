@@ -0,0 +1,135 @@
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DICTIONARY_FILE = os.path.join(ROOT_DIR, "lib", "dictionary.json")
+OUTPUT_FILE = os.path.join(ROOT_DIR, "lib", "dictionaryGraph.json")
+
+FORMAT_VERSION = 1
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def load_words(path=DICTIONARY_FILE):
+    """Load the dictionary as a sorted list of unique uppercase words"""
+    with open(path) as f:
+        raw_words = json.load(f)
+    return sorted({word.strip().upper() for word in raw_words if word.strip().isalpha()})
+
+
+def signature(word):
+    """Letter multiset of a word as a sorted string (same as the client's bySignature key)"""
+    return "".join(sorted(word))
+
+
+def build_signature_index(words):
+    """Map each letter signature to the ids of the words that share it"""
+    by_signature = {}
+    for word_id, word in enumerate(words):
+        by_signature.setdefault(signature(word), []).append(word_id)
+    return by_signature
+
+
+def neighbors_one_change_reorder(word, by_signature):
+    """Ids of words reachable by changing exactly one letter, rearrangement allowed"""
+    counts = {}
+    for letter in word:
+        counts[letter] = counts.get(letter, 0) + 1
+
+    result = set()
+    for removed in list(counts):
+        counts[removed] -= 1
+        for added in ALPHABET:
+            if added == removed:
+                continue
+            counts[added] = counts.get(added, 0) + 1
+            sig = "".join(letter * counts.get(letter, 0) for letter in ALPHABET)
+            result.update(by_signature.get(sig, ()))
+            counts[added] -= 1
+        counts[removed] += 1
+    return result
+
+
+def build_adjacency(words):
+    """Sorted neighbor id list for every word id"""
+    by_signature = build_signature_index(words)
+    adjacency = []
+    for word_id, word in enumerate(words):
+        neighbor_ids = neighbors_one_change_reorder(word, by_signature)
+        neighbor_ids.discard(word_id)
+        adjacency.append(sorted(neighbor_ids))
+    return adjacency
+
+
+def delta_encode(ids):
+    """Encode a sorted id list as the first id followed by the gaps between ids"""
+    encoded = []
+    previous = 0
+    for value in ids:
+        encoded.append(value - previous)
+        previous = value
+    return encoded
+
+
+def delta_decode(deltas):
+    """Inverse of delta_encode"""
+    ids = []
+    current = 0
+    for gap in deltas:
+        current += gap
+        ids.append(current)
+    return ids
+
+
+def build_neighbor_index(words):
+    """Build the exported index: word table, degrees and flat delta-encoded neighbor lists.
+
+    Neighbors of word i are the next degree[i] entries of "neighbors", starting at
+    sum(degree[:i]); each run is delta-encoded independently, starting from zero.
+    """
+    adjacency = build_adjacency(words)
+    neighbors = []
+    for neighbor_ids in adjacency:
+        neighbors.extend(delta_encode(neighbor_ids))
+    return {
+        "version": FORMAT_VERSION,
+        "words": words,
+        "degree": [len(neighbor_ids) for neighbor_ids in adjacency],
+        "neighbors": neighbors,
+    }
+
+
+def decode_neighbor_index(index):
+    """Expand an exported index back into {word: [neighbor words]}"""
+    words = index["words"]
+    neighbors = index["neighbors"]
+    result = {}
+    offset = 0
+    for word, degree in zip(words, index["degree"]):
+        ids = delta_decode(neighbors[offset:offset + degree])
+        result[word] = [words[i] for i in ids]
+        offset += degree
+    return result
+
+
+def main(argv):
+    output_path = argv[1] if len(argv) > 1 else OUTPUT_FILE
+
+    words = load_words()
+    index = build_neighbor_index(words)
+
+    with open(output_path, "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+        f.write("\n")
+
+    edges = sum(index["degree"]) // 2
+    isolated = sum(1 for degree in index["degree"] if degree == 0)
+    print(f"Wrote {os.path.relpath(output_path, ROOT_DIR)}")
+    print(f"  Words: {len(words)}")
+    print(f"  Edges: {edges}")
+    print(f"  Max degree: {max(index['degree'], default=0)}")
+    print(f"  Isolated words: {isolated}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,267 @@
+import json
+import os
+import sys
+from array import array
+from collections import deque
+
+from build_neighbor_index import ROOT_DIR, load_words
+from packed_words import PackedGraph, WordTable, pack_counts
+
+DEFINITIONS_FILE = os.path.join(ROOT_DIR, "lib", "wordDefinitions.json")
+PREVIOUS_DEFINITIONS_FILE = os.path.join(ROOT_DIR, "lib", "wordDefinitions_previous.json")
+PUZZLES_FILE = os.path.join(ROOT_DIR, "data", "puzzles-2025.json")
+
+
+def normalize(words):
+    return {word.strip().upper() for word in words}
+
+
+class DictionarySnapshotStore:
+    """Dictionary versions stored as add/remove deltas against a shared base word list"""
+
+    def __init__(self, base_words):
+        self.base_words = sorted(normalize(base_words))
+        self.versions = {}
+        self._base_set = None
+        self._base_graph = None
+
+    def base_set(self):
+        if self._base_set is None:
+            self._base_set = set(self.base_words)
+        return self._base_set
+
+    def base_graph(self):
+        """Packed adjacency of the base, built once and shared by every overlay"""
+        if self._base_graph is None:
+            self._base_graph = PackedGraph(WordTable(self.base_words))
+        return self._base_graph
+
+    def record_delta(self, name, added=(), removed=(), parent=None):
+        """Record a version as words added and removed relative to parent (or the base)"""
+        if name in self.versions:
+            raise ValueError(f"Version {name!r} already exists")
+        if parent is not None and parent not in self.versions:
+            raise KeyError(f"Unknown parent version {parent!r}")
+        self.versions[name] = {
+            "parent": parent,
+            "added": sorted(normalize(added)),
+            "removed": sorted(normalize(removed)),
+        }
+
+    def record_words(self, name, words, parent=None):
+        """Record a full word list as a version, keeping only its delta against parent"""
+        words = normalize(words)
+        parent_added, parent_removed = self.delta(parent)
+        previous = (self.base_set() - parent_removed) | parent_added
+        self.record_delta(name, words - previous, previous - words, parent)
+
+    def delta(self, name):
+        """Net (added, removed) word sets of a version against the base"""
+        added, removed = set(), set()
+        if name is None:
+            return added, removed
+
+        chain = []
+        while name is not None:
+            chain.append(self.versions[name])
+            name = self.versions[name]["parent"]
+
+        for version in reversed(chain):
+            for word in version["removed"]:
+                if word in added:
+                    added.discard(word)
+                else:
+                    removed.add(word)
+            for word in version["added"]:
+                if word in removed:
+                    removed.discard(word)
+                else:
+                    added.add(word)
+        return added, removed
+
+    def words(self, name):
+        """Materialize the full word list of a version"""
+        added, removed = self.delta(name)
+        return sorted((self.base_set() - removed) | added)
+
+    def graph(self, name):
+        """Overlay view of a version on top of the shared base graph"""
+        added, removed = self.delta(name)
+        return OverlayGraph(self.base_graph(), added, removed)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"base": self.base_words, "versions": self.versions}, f, indent=2)
+            f.write("\n")
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        store = cls(data["base"])
+        store.versions = data["versions"]
+        return store
+
+
+class OverlayGraph:
+    """A base PackedGraph with words added and removed, without copying the base adjacency.
+
+    Base words keep their ids; added words get ids after the last base id. Only edges
+    touching added words are stored, so memory grows with the delta, not the dictionary.
+    """
+
+    def __init__(self, base_graph, added=(), removed=()):
+        self.base = base_graph
+        table = base_graph.table
+        self.base_size = len(table)
+
+        self.removed_ids = {table.id_of(word) for word in removed} - {None}
+        self.added_words = sorted(word for word in normalize(added) if table.id_of(word) is None)
+        self.added_ids = {word: self.base_size + k for k, word in enumerate(self.added_words)}
+
+        self.extra_edges = {}
+        self.added_table = added_table = WordTable(self.added_words)
+        for k in range(len(added_table)):
+            overlay_id = self.base_size + k
+            for base_id in table.neighbors_of_counts(added_table.counts[k]):
+                self._link(overlay_id, base_id)
+                self._link(base_id, overlay_id)
+            for other in added_table.neighbors(k):
+                self._link(overlay_id, self.base_size + other)
+
+    def _link(self, from_id, to_id):
+        self.extra_edges.setdefault(from_id, []).append(to_id)
+
+    def __len__(self):
+        return self.base_size + len(self.added_words)
+
+    def id_of(self, word):
+        word = word.upper()
+        word_id = self.base.table.id_of(word)
+        if word_id is None:
+            return self.added_ids.get(word)
+        return None if word_id in self.removed_ids else word_id
+
+    def word_of(self, word_id):
+        if word_id < self.base_size:
+            return self.base.table.word_of(word_id)
+        return self.added_words[word_id - self.base_size]
+
+    def __contains__(self, word):
+        return self.id_of(word) is not None
+
+    def neighbors(self, word_id):
+        if word_id in self.removed_ids:
+            return []
+        result = list(self.base.neighbors(word_id)) if word_id < self.base_size else []
+        result.extend(self.extra_edges.get(word_id, ()))
+        if self.removed_ids:
+            result = [other for other in result if other not in self.removed_ids]
+        return result
+
+    def neighbors_of_word(self, word):
+        """Ids one letter change away from any word, whether or not it is in the overlay"""
+        counts = pack_counts(word)
+        result = [other for other in self.base.table.neighbors_of_counts(counts)
+                  if other not in self.removed_ids]
+        result.extend(self.base_size + k for k in self.added_table.neighbors_of_counts(counts))
+        return result
+
+    def shortest_path(self, start, target):
+        """Shortest path between two words by BFS over the overlay, or None if unreachable.
+
+        The start word does not have to be in the dictionary, only every later step.
+        """
+        start = start.upper()
+        start_id = self.id_of(start)
+        target_id = self.id_of(target)
+        if target_id is None:
+            return None
+        if start_id == target_id:
+            return [start]
+
+        visited = bytearray(len(self))
+        parent = array("i", [-1]) * len(self)
+        if start_id is not None:
+            visited[start_id] = 1
+            queue = deque([start_id])
+        else:
+            # Seed the search with the first step so unknown start words still work
+            queue = deque()
+            for nxt in self.neighbors_of_word(start):
+                if visited[nxt]:
+                    continue
+                visited[nxt] = 1
+                if nxt == target_id:
+                    return [start, self.word_of(nxt)]
+                queue.append(nxt)
+
+        while queue:
+            current = queue.popleft()
+            for nxt in self.neighbors(current):
+                if visited[nxt]:
+                    continue
+                visited[nxt] = 1
+                parent[nxt] = current
+                if nxt == target_id:
+                    path = []
+                    while nxt != -1:
+                        path.append(self.word_of(nxt))
+                        nxt = parent[nxt]
+                    if start_id is None:
+                        path.append(start)
+                    return path[::-1]
+                queue.append(nxt)
+
+        return None  # No path found
+
+
+def load_definition_words(path):
+    with open(path) as f:
+        return json.load(f)["definitions"].keys()
+
+
+def compare_versions(store, names, pairs):
+    """Shortest path length of each pair under each version, side by side"""
+    graphs = [store.graph(name) for name in names]
+    rows = []
+    for start, target in pairs:
+        steps = []
+        for graph in graphs:
+            path = graph.shortest_path(start, target)
+            steps.append(len(path) - 1 if path else None)
+        rows.append((start, target, steps))
+    return rows
+
+
+def main(argv):
+    store = DictionarySnapshotStore(load_words())
+    store.record_words("definitions-previous", load_definition_words(PREVIOUS_DEFINITIONS_FILE))
+    store.record_words("definitions", load_definition_words(DEFINITIONS_FILE),
+                       parent="definitions-previous")
+
+    print("=== DICTIONARY SNAPSHOTS ===\n")
+    print(f"Base (lib/dictionary.json): {len(store.base_words)} words")
+    for name in store.versions:
+        added, removed = store.delta(name)
+        print(f"{name}: +{len(added)} -{len(removed)} against base")
+
+    with open(PUZZLES_FILE) as f:
+        pairs = [(p["root"], p["mystery"]) for p in json.load(f)]
+
+    names = [None, "definitions-previous", "definitions"]
+    labels = ["base", "previous", "current"]
+    changed = [row for row in compare_versions(store, names, pairs) if len(set(row[2])) > 1]
+
+    print(f"\nPuzzles whose step count differs between versions: {len(changed)} of {len(pairs)}")
+    for start, target, steps in changed:
+        cells = ", ".join(f"{label}={s if s is not None else 'none'}" for label, s in zip(labels, steps))
+        print(f"  {start} → {target}: {cells}")
+
+    if len(argv) > 1:
+        store.save(argv[1])
+        print(f"\nSaved store to {argv[1]}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,250 @@
+import random
+import sys
+import time
+from array import array
+from collections import deque
+
+from build_neighbor_index import load_words
+
+# Letters are stored 1-26 in 5-bit fields so that 0 marks "no letter"
+LETTER_BITS = 5
+LETTER_MASK = (1 << LETTER_BITS) - 1
+
+# Letter multisets are 26 counts in 3-bit fields, so a word may repeat a letter at most 7 times.
+# The one-change test below is only exact for equal-length words of up to 7 letters.
+COUNT_BITS = 3
+COUNT_MASK = (1 << COUNT_BITS) - 1
+MAX_WORD_LENGTH = 7
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+UNIT = [1 << (COUNT_BITS * i) for i in range(26)]
+
+
+def pack_letters(word):
+    """Pack a word into an int, 5 bits per letter, first letter in the lowest bits"""
+    packed = 0
+    for position, letter in enumerate(word.upper()):
+        packed |= (ord(letter) - 64) << (LETTER_BITS * position)
+    return packed
+
+
+def unpack_letters(packed):
+    """Inverse of pack_letters"""
+    letters = []
+    while packed:
+        letters.append(chr((packed & LETTER_MASK) + 64))
+        packed >>= LETTER_BITS
+    return "".join(letters)
+
+
+def pack_counts(word):
+    """Pack the letter multiset of a word into an int, 3 bits per letter count"""
+    packed = 0
+    for letter in word.upper():
+        packed += UNIT[ord(letter) - 65]
+    return packed
+
+
+def is_one_change(counts1, counts2):
+    """Check if two packed multisets of equal-length words differ by exactly one letter.
+
+    That holds exactly when counts2 - counts1 == +/-(8**j - 8**i) for letters i != j,
+    i.e. the difference is a run of 3k one-bits starting on a field boundary.
+    """
+    diff = counts2 - counts1
+    if diff < 0:
+        diff = -diff
+    if diff == 0:
+        return False
+    low_bit = diff & -diff
+    shift = low_bit.bit_length() - 1
+    run = diff >> shift
+    return shift % COUNT_BITS == 0 and run & (run + 1) == 0 and run.bit_length() % COUNT_BITS == 0
+
+
+class WordTable:
+    """Word <-> id table with packed letters and packed letter multisets per id"""
+
+    def __init__(self, words):
+        self.words = list(words)
+        if any(len(word) > MAX_WORD_LENGTH for word in self.words):
+            raise ValueError(f"Words longer than {MAX_WORD_LENGTH} letters cannot be packed")
+
+        self.ids = {word: word_id for word_id, word in enumerate(self.words)}
+        self.lengths = array("B", (len(word) for word in self.words))
+        self.letters = array("Q", (pack_letters(word) for word in self.words))
+        # 26 * 3 = 78 bits does not fit a machine word, so counts stay Python ints
+        self.counts = [pack_counts(word) for word in self.words]
+
+        # First id for each multiset, other anagrams chained through next_anagram
+        self.first_by_counts = {}
+        self.next_anagram = array("i", [-1]) * len(self.words)
+        for word_id in range(len(self.words) - 1, -1, -1):
+            key = self.counts[word_id]
+            self.next_anagram[word_id] = self.first_by_counts.get(key, -1)
+            self.first_by_counts[key] = word_id
+
+    def __len__(self):
+        return len(self.words)
+
+    def id_of(self, word):
+        return self.ids.get(word.upper())
+
+    def word_of(self, word_id):
+        return self.words[word_id]
+
+    def is_valid_move(self, from_id, to_id):
+        """Check if moving from one id to another changes exactly one letter"""
+        return (self.lengths[from_id] == self.lengths[to_id]
+                and is_one_change(self.counts[from_id], self.counts[to_id]))
+
+    def neighbors(self, word_id):
+        """Ids reachable from word_id by one letter change, rearrangement allowed"""
+        return self.neighbors_of_counts(self.counts[word_id])
+
+    def neighbors_of_counts(self, counts):
+        """Ids one letter change away from a packed multiset, which need not be in the table"""
+        first_by_counts = self.first_by_counts
+        next_anagram = self.next_anagram
+        result = []
+        for i in range(26):
+            if not (counts >> (COUNT_BITS * i)) & COUNT_MASK:
+                continue
+            removed = counts - UNIT[i]
+            for j in range(26):
+                if j == i or (counts >> (COUNT_BITS * j)) & COUNT_MASK == COUNT_MASK:
+                    continue
+                other = first_by_counts.get(removed + UNIT[j], -1)
+                while other != -1:
+                    result.append(other)
+                    other = next_anagram[other]
+        return result
+
+
+class PackedGraph:
+    """Adjacency of a WordTable in compressed rows: offsets[i]:offsets[i+1] index into targets"""
+
+    def __init__(self, table):
+        self.table = table
+        self.offsets = array("I", [0])
+        self.targets = array("I")
+        for word_id in range(len(table)):
+            self.targets.extend(table.neighbors(word_id))
+            self.offsets.append(len(self.targets))
+
+    def degree(self, word_id):
+        return self.offsets[word_id + 1] - self.offsets[word_id]
+
+    def neighbors(self, word_id):
+        return self.targets[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def nbytes(self):
+        """Bytes held by the adjacency arrays"""
+        return (self.offsets.itemsize * len(self.offsets)
+                + self.targets.itemsize * len(self.targets))
+
+    def shortest_path(self, start, target):
+        """Shortest path between two words by BFS over ids, or None if unreachable"""
+        start_id = self.table.id_of(start)
+        target_id = self.table.id_of(target)
+        if start_id is None or target_id is None:
+            return None
+        if start_id == target_id:
+            return [self.table.word_of(start_id)]
+
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(len(self.table))
+        parent = array("i", [-1]) * len(self.table)
+        visited[start_id] = 1
+        queue = deque([start_id])
+
+        while queue:
+            current = queue.popleft()
+            for k in range(offsets[current], offsets[current + 1]):
+                nxt = targets[k]
+                if visited[nxt]:
+                    continue
+                visited[nxt] = 1
+                parent[nxt] = current
+                if nxt == target_id:
+                    return self._reconstruct(parent, nxt)
+                queue.append(nxt)
+
+        return None  # No path found
+
+    def distances_from(self, start):
+        """BFS distance from one word to every id (-1 where unreachable)"""
+        start_id = self.table.id_of(start)
+        distance = array("i", [-1]) * len(self.table)
+        if start_id is None:
+            return distance
+
+        offsets, targets = self.offsets, self.targets
+        distance[start_id] = 0
+        queue = deque([start_id])
+        while queue:
+            current = queue.popleft()
+            next_distance = distance[current] + 1
+            for k in range(offsets[current], offsets[current + 1]):
+                nxt = targets[k]
+                if distance[nxt] == -1:
+                    distance[nxt] = next_distance
+                    queue.append(nxt)
+        return distance
+
+    def _reconstruct(self, parent, word_id):
+        path = []
+        while word_id != -1:
+            path.append(self.table.word_of(word_id))
+            word_id = parent[word_id]
+        path.reverse()
+        return path
+
+
+def synthetic_words(count, length=5, seed=0):
+    """Generate a sorted list of distinct random words for scale testing"""
+    if count > 26 ** length:
+        raise ValueError(f"Cannot generate {count} distinct words of length {length}")
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(ALPHABET) for _ in range(length)))
+    return sorted(words)
+
+
+def main(argv):
+    if len(argv) > 1:
+        words = synthetic_words(int(argv[1]))
+        source = f"synthetic ({len(words)} words)"
+    else:
+        words = load_words()
+        source = "lib/dictionary.json"
+
+    began = time.perf_counter()
+    table = WordTable(words)
+    graph = PackedGraph(table)
+    elapsed = time.perf_counter() - began
+
+    print(f"=== PACKED WORD GRAPH: {source} ===\n")
+    print(f"Words: {len(table)}")
+    print(f"Edges: {len(graph.targets) // 2}")
+    print(f"Adjacency size: {graph.nbytes() / 1024:.1f} KiB")
+    print(f"Build time: {elapsed:.2f}s\n")
+
+    pairs = [(words[0], words[-1]), (words[len(words) // 3], words[2 * len(words) // 3])]
+    if "DANCE" in table.ids and "LIGHT" in table.ids:
+        pairs.insert(0, ("DANCE", "LIGHT"))
+
+    for start, target in pairs:
+        began = time.perf_counter()
+        path = graph.shortest_path(start, target)
+        elapsed = time.perf_counter() - began
+        if path:
+            print(f"{start} → {target}: {len(path) - 1} steps ({elapsed * 1000:.1f} ms)")
+            print(f"  {' → '.join(path)}")
+        else:
+            print(f"{start} → {target}: no path ({elapsed * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
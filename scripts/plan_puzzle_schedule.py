@@ -0,0 +1,475 @@
+import argparse
+import json
+import math
+import os
+import random
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+from build_neighbor_index import ROOT_DIR, load_words
+from packed_words import PackedGraph, WordTable
+
+CLUES_FILE = os.path.join(ROOT_DIR, "lib", "clues.json")
+
+MIN_STEPS = 4
+MAX_STEPS = 7
+REPEAT_WINDOW_DAYS = 60
+MYSTERIES_PER_ROOT = 3
+
+# Score weights (lower total score is better)
+RAMP_WEIGHT = 1.0          # per squared step of difficulty away from the weekday target
+MISSING_CLUE_WEIGHT = 25.0  # per path word that has no entry in lib/clues.json
+REPEAT_WEIGHT = 50.0        # per pair of uses of a root/mystery word inside the repeat window
+CLUE_REUSE_WEIGHT = 0.2     # per earlier use of the same clue word elsewhere in the schedule
+
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+def load_clues(path=CLUES_FILE):
+    with open(path) as f:
+        data = json.load(f)
+    return {word.lower() for word in data.get("clues", data)}
+
+
+def difficulty(candidate, calibration=None):
+    """Step count, nudged up when few shortest paths exist, then corrected by player data"""
+    if candidate["path_count"] == 1:
+        level = candidate["steps"] + 1.0
+    elif candidate["path_count"] <= 3:
+        level = candidate["steps"] + 0.5
+    else:
+        level = float(candidate["steps"])
+    return level + (calibration or {}).get(level, 0.0)
+
+
+def calibrate_difficulty(graph, clues, stats_path):
+    """Per difficulty level, how many more excess moves winners needed than on average.
+
+    Reads the per-date stats written by analyze_player_logs.py. Levels players found
+    harder than the model predicts are shifted up, easier ones down.
+    """
+    with open(stats_path) as f:
+        dates = json.load(f)["dates"]
+
+    totals = {}
+    for stats in dates.values():
+        if not stats["wins"] or stats["mean_excess_moves"] is None:
+            continue
+        features = features_for_pair(graph, clues, stats["root"], stats["mystery"])
+        if features is None:
+            continue
+        level = difficulty(features)
+        excess, wins = totals.get(level, (0.0, 0))
+        totals[level] = (excess + stats["mean_excess_moves"] * stats["wins"], wins + stats["wins"])
+
+    all_wins = sum(wins for _, wins in totals.values())
+    if not all_wins:
+        return {}
+    overall = sum(excess for excess, _ in totals.values()) / all_wins
+    return {level: excess / wins - overall for level, (excess, wins) in totals.items()}
+
+
+def weekday_targets(easiest, hardest):
+    """Target difficulty per weekday, ramping from Monday to Sunday"""
+    return [easiest + (hardest - easiest) * day / 6 for day in range(7)]
+
+
+def search_from(graph, root_id):
+    """BFS from one root: distance, number of shortest paths and a parent for every id"""
+    size = len(graph.table)
+    distance = array("i", [-1]) * size
+    parent = array("i", [-1]) * size
+    path_count = [0] * size
+    distance[root_id] = 0
+    path_count[root_id] = 1
+    offsets, targets = graph.offsets, graph.targets
+    queue = deque([root_id])
+
+    while queue:
+        current = queue.popleft()
+        next_distance = distance[current] + 1
+        for k in range(offsets[current], offsets[current + 1]):
+            nxt = targets[k]
+            if distance[nxt] == -1:
+                distance[nxt] = next_distance
+                parent[nxt] = current
+                queue.append(nxt)
+            if distance[nxt] == next_distance:
+                path_count[nxt] += path_count[current]
+    return distance, path_count, parent
+
+
+def make_candidate(graph, clues, mystery_id, search):
+    distance, path_count, parent = search
+    path = []
+    word_id = mystery_id
+    while word_id != -1:
+        path.append(graph.table.word_of(word_id))
+        word_id = parent[word_id]
+    path.reverse()
+    return {
+        "root": path[0],
+        "mystery": path[-1],
+        "steps": distance[mystery_id],
+        "path_count": path_count[mystery_id],
+        "missing_clues": sum(1 for word in path[1:] if word.lower() not in clues),
+        "clue_words": path[1:-1],
+    }
+
+
+def build_candidate_pool(graph, clues, size, min_steps=MIN_STEPS, max_steps=MAX_STEPS, seed=0):
+    """Sample root/mystery pairs with their length, path-count and clue features"""
+    rng = random.Random(seed)
+    root_ids = list(range(len(graph.table)))
+    rng.shuffle(root_ids)
+
+    pool = []
+    for root_id in root_ids:
+        if len(pool) >= size:
+            break
+        if graph.table.word_of(root_id).lower() not in clues:
+            continue
+        search = search_from(graph, root_id)
+        reachable = [word_id for word_id, steps in enumerate(search[0])
+                     if min_steps <= steps <= max_steps]
+        for mystery_id in rng.sample(reachable, min(MYSTERIES_PER_ROOT, len(reachable))):
+            pool.append(make_candidate(graph, clues, mystery_id, search))
+    return pool[:size]
+
+
+def features_for_pair(graph, clues, root, mystery):
+    """Features of a given pair, or None when it has no path in the dictionary"""
+    root_id = graph.table.id_of(root)
+    mystery_id = graph.table.id_of(mystery)
+    if root_id is None or mystery_id is None:
+        return None
+    search = search_from(graph, root_id)
+    if search[0][mystery_id] == -1:
+        return None
+    return make_candidate(graph, clues, mystery_id, search)
+
+
+class ScheduleState:
+    """Assignment of candidates to days with an incrementally maintained score"""
+
+    def __init__(self, problem):
+        candidates = problem["candidates"]
+        targets = problem["targets"]
+        calibration = problem["calibration"]
+        self.weekdays = problem["weekdays"]
+        self.window = problem["window"]
+        self.words = [(c["root"].upper(), c["mystery"].upper()) for c in candidates]
+        self.clue_words = [tuple(c["clue_words"]) for c in candidates]
+        self.local = []
+        for c in candidates:
+            if c.get("locked"):
+                self.local.append((0.0,) * 7)
+                continue
+            d = difficulty(c, calibration)
+            missing = MISSING_CLUE_WEIGHT * c["missing_clues"]
+            self.local.append(tuple(RAMP_WEIGHT * (d - t) ** 2 + missing for t in targets))
+
+        self.assignment = [-1] * len(self.weekdays)
+        self.used = bytearray(len(candidates))
+        self.occurrences = {}
+        self.clue_uses = {}
+        self.score = 0.0
+
+    def conflicts(self, word, day):
+        window = self.window
+        return sum(1 for other in self.occurrences.get(word, ()) if abs(other - day) < window)
+
+    def place(self, day, c):
+        delta = self.local[c][self.weekdays[day]]
+        for word in self.words[c]:
+            delta += REPEAT_WEIGHT * self.conflicts(word, day)
+            self.occurrences.setdefault(word, []).append(day)
+        for word in self.clue_words[c]:
+            uses = self.clue_uses.get(word, 0)
+            delta += CLUE_REUSE_WEIGHT * uses
+            self.clue_uses[word] = uses + 1
+        self.assignment[day] = c
+        self.used[c] = 1
+        self.score += delta
+        return delta
+
+    def unplace(self, day):
+        c = self.assignment[day]
+        delta = -self.local[c][self.weekdays[day]]
+        for word in self.words[c]:
+            self.occurrences[word].remove(day)
+            delta -= REPEAT_WEIGHT * self.conflicts(word, day)
+        for word in self.clue_words[c]:
+            uses = self.clue_uses[word] - 1
+            delta -= CLUE_REUSE_WEIGHT * uses
+            self.clue_uses[word] = uses
+        self.assignment[day] = -1
+        self.used[c] = 0
+        self.score += delta
+        return delta
+
+
+def initial_state(problem, rng):
+    """Locked days as given, planned days seeded from the draft or greedily from a sample"""
+    state = ScheduleState(problem)
+    for day, c in problem["locked"].items():
+        state.place(day, c)
+
+    pool = problem["pool"]
+    for day in problem["free_days"]:
+        c = problem["draft"].get(day)
+        if c is None or state.used[c]:
+            options = [c for c in rng.sample(pool, min(32, len(pool))) if not state.used[c]]
+            if not options:
+                options = [c for c in pool if not state.used[c]]
+            weekday = state.weekdays[day]
+            c = min(options, key=lambda c: state.local[c][weekday]
+                    + REPEAT_WEIGHT * sum(state.conflicts(word, day) for word in state.words[c]))
+        state.place(day, c)
+    return state
+
+
+def anneal(problem, seed, iterations, start_temperature=2.0, end_temperature=0.01):
+    """One simulated-annealing run; returns (best score, best assignment)"""
+    rng = random.Random(seed)
+    state = initial_state(problem, rng)
+    free_days = problem["free_days"]
+    pool = problem["pool"]
+    best_score = state.score
+    best_assignment = list(state.assignment)
+    if not free_days:
+        return best_score, best_assignment
+
+    cooling = (end_temperature / start_temperature) ** (1 / max(iterations, 1))
+    temperature = start_temperature
+
+    for _ in range(iterations):
+        temperature *= cooling
+        if len(free_days) > 1 and rng.random() < 0.5:
+            day1, day2 = rng.sample(free_days, 2)
+            c1, c2 = state.assignment[day1], state.assignment[day2]
+            delta = state.unplace(day1) + state.unplace(day2)
+            delta += state.place(day1, c2) + state.place(day2, c1)
+            if delta > 0 and rng.random() >= math.exp(-delta / temperature):
+                state.unplace(day1)
+                state.unplace(day2)
+                state.place(day1, c1)
+                state.place(day2, c2)
+                continue
+        else:
+            day = rng.choice(free_days)
+            c = rng.choice(pool)
+            if state.used[c]:
+                continue
+            old = state.assignment[day]
+            delta = state.unplace(day) + state.place(day, c)
+            if delta > 0 and rng.random() >= math.exp(-delta / temperature):
+                state.unplace(day)
+                state.place(day, old)
+                continue
+
+        if state.score < best_score - 1e-9:
+            best_score = state.score
+            best_assignment = list(state.assignment)
+
+    return best_score, best_assignment
+
+
+def _anneal_job(args):
+    return anneal(*args)
+
+
+def optimize(problem, restarts, iterations, workers, seed=0):
+    """Best of several independent annealing runs, spread over a process pool"""
+    jobs = [(problem, seed + k, iterations) for k in range(restarts)]
+    if workers <= 1:
+        results = [_anneal_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_anneal_job, jobs))
+    return min(results, key=lambda result: result[0])
+
+
+def build_problem(dates, pool, locked_rows, draft_rows, targets, window, plan_from, calibration=None):
+    """Index dates and candidates; locked rows are fixed, draft rows only seed the search.
+
+    locked_rows holds (row, features) tuples, features being None for pairs without a path.
+    Only dates from plan_from on are planned; earlier dates without a row stay empty.
+    """
+    candidates = list(pool)
+    index_of = {(c["root"], c["mystery"]): k for k, c in enumerate(candidates)}
+    day_of = {d.isoformat(): k for k, d in enumerate(dates)}
+
+    locked = {}
+    for row, features in locked_rows:
+        candidate = dict(features or {"clue_words": []})
+        candidate.update(root=row["root"].upper(), mystery=row["mystery"].upper(), locked=True)
+        locked[day_of[row["date"]]] = len(candidates)
+        candidates.append(candidate)
+
+    published = {(candidates[c]["root"], candidates[c]["mystery"]) for c in locked.values()}
+    pool_ids = [k for k, c in enumerate(candidates[:len(pool)])
+                if (c["root"], c["mystery"]) not in published]
+
+    draft = {}
+    for row in draft_rows:
+        k = index_of.get((row["root"].upper(), row["mystery"].upper()))
+        if k is not None:
+            draft[day_of[row["date"]]] = k
+
+    free_days = [k for k, d in enumerate(dates) if k not in locked and d >= plan_from]
+    if len(pool_ids) < len(free_days):
+        raise ValueError(f"Candidate pool has {len(pool_ids)} usable pairs for {len(free_days)} days")
+
+    return {
+        "candidates": candidates,
+        "weekdays": [d.weekday() for d in dates],
+        "targets": targets,
+        "calibration": calibration or {},
+        "window": window,
+        "locked": locked,
+        "draft": draft,
+        "free_days": free_days,
+        "pool": pool_ids,
+    }
+
+
+def validate(problem, assignment, min_steps, max_steps):
+    """List every hard-rule violation in an assignment (empty when the schedule is valid)"""
+    candidates = problem["candidates"]
+    window = problem["window"]
+    issues = []
+    last_seen = {}
+    for day, c in enumerate(assignment):
+        if c == -1:
+            continue
+        candidate = candidates[c]
+        if not candidate.get("locked"):
+            if not min_steps <= candidate["steps"] <= max_steps:
+                issues.append(f"day {day}: {candidate['steps']} steps")
+            if candidate["missing_clues"]:
+                issues.append(f"day {day}: {candidate['missing_clues']} path words without clues")
+        for word in (candidate["root"], candidate["mystery"]):
+            previous = last_seen.get(word)
+            if (previous is not None and day - previous < window
+                    and not (candidate.get("locked") and candidates[assignment[previous]].get("locked"))):
+                issues.append(f"day {day}: {word} repeats after {day - previous} days")
+            last_seen[word] = day
+    return issues
+
+
+def parse_date(text):
+    return date.fromisoformat(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assign puzzle pairs to dates under difficulty constraints")
+    parser.add_argument("--start", type=parse_date, help="first date to plan (default: first date in --existing)")
+    parser.add_argument("--end", type=parse_date, help="last date to plan (default: last date in --existing)")
+    parser.add_argument("--existing", help="schedule file whose published dates are kept unchanged")
+    parser.add_argument("--published-through", type=parse_date, default=date.today(),
+                        help="last published date in --existing (default: today)")
+    parser.add_argument("--output", help="where to write the schedule (default: only print a summary)")
+    parser.add_argument("--pool", help="precomputed candidate pool JSON")
+    parser.add_argument("--save-pool", help="write the candidate pool JSON here")
+    parser.add_argument("--pool-size", type=int, default=4000)
+    parser.add_argument("--min-steps", type=int, default=MIN_STEPS)
+    parser.add_argument("--max-steps", type=int, default=MAX_STEPS)
+    parser.add_argument("--window", type=int, default=REPEAT_WINDOW_DAYS, help="no-repeat window in days")
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--restarts", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--player-stats", help="per-date stats from analyze_player_logs.py to calibrate difficulty")
+    args = parser.parse_args()
+
+    began = time.perf_counter()
+    graph = PackedGraph(WordTable(load_words()))
+    clues = load_clues()
+
+    existing = []
+    if args.existing:
+        with open(args.existing) as f:
+            existing = json.load(f)
+    start = args.start or (parse_date(min(row["date"] for row in existing)) if existing else None)
+    end = args.end or (parse_date(max(row["date"] for row in existing)) if existing else None)
+    if start is None or end is None or end < start:
+        parser.error("a date range is required (--start/--end or --existing)")
+    dates = [start + timedelta(days=k) for k in range((end - start).days + 1)]
+    in_range = [row for row in existing if start <= parse_date(row["date"]) <= end]
+
+    # Published rows are locked; they also count toward the repeat window of their neighbours
+    locked_rows = [(row, features_for_pair(graph, clues, row["root"], row["mystery"]))
+                   for row in in_range if parse_date(row["date"]) <= args.published_through]
+    draft_rows = [row for row in in_range if parse_date(row["date"]) > args.published_through]
+
+    if args.pool:
+        with open(args.pool) as f:
+            pool = json.load(f)
+    else:
+        pool = build_candidate_pool(graph, clues, args.pool_size, args.min_steps, args.max_steps, args.seed)
+    for row in draft_rows:
+        features = features_for_pair(graph, clues, row["root"], row["mystery"])
+        if features and args.min_steps <= features["steps"] <= args.max_steps:
+            pool.append(features)
+    if args.save_pool:
+        with open(args.save_pool, "w") as f:
+            json.dump(pool, f)
+
+    calibration = calibrate_difficulty(graph, clues, args.player_stats) if args.player_stats else None
+    targets = weekday_targets(args.min_steps, args.max_steps)
+    plan_from = max(start, args.published_through + timedelta(days=1)) if args.existing else start
+    problem = build_problem(dates, pool, locked_rows, draft_rows, targets, args.window, plan_from, calibration)
+    prepared = time.perf_counter()
+
+    score, assignment = optimize(problem, args.restarts, args.iterations, args.workers, args.seed)
+    issues = validate(problem, assignment, args.min_steps, args.max_steps)
+    finished = time.perf_counter()
+
+    candidates = problem["candidates"]
+    print("=== PUZZLE SCHEDULE ===\n")
+    print(f"Dates: {dates[0]} to {dates[-1]} ({len(problem['free_days'])} planned, "
+          f"{len(problem['locked'])} locked)")
+    print(f"Candidate pool: {len(problem['pool'])} pairs")
+    print(f"Score: {score:.1f} (best of {args.restarts} restarts × {args.iterations} iterations)")
+    print(f"Time: {prepared - began:.1f}s setup, {finished - prepared:.1f}s optimizing\n")
+
+    if calibration:
+        print("Difficulty calibration from player stats:")
+        for level in sorted(calibration):
+            print(f"  {level:.1f}: {calibration[level]:+.2f}")
+        print()
+
+    print("Average difficulty by weekday (planned days):")
+    for weekday, name in enumerate(WEEKDAY_NAMES):
+        values = [difficulty(candidates[assignment[day]], calibration) for day in problem["free_days"]
+                  if problem["weekdays"][day] == weekday]
+        if values:
+            print(f"  {name}: {sum(values) / len(values):.2f} (target {targets[weekday]:.2f})")
+
+    clue_words = {word for day in problem["free_days"] for word in candidates[assignment[day]]["clue_words"]}
+    print(f"\nDistinct clue words used: {len(clue_words)} of {len(clues)}")
+
+    if issues:
+        print(f"\n❌ {len(issues)} constraint violations:")
+        for issue in issues[:20]:
+            print(f"  {issue}")
+    else:
+        print("\n✅ Schedule is valid")
+
+    if args.output:
+        planned = {dates[day].isoformat(): candidates[assignment[day]] for day in problem["free_days"]}
+        rows = [row for row in existing if row["date"] not in planned]
+        rows.extend({"date": day, "root": c["root"], "mystery": c["mystery"]} for day, c in planned.items())
+        rows.sort(key=lambda row: row["date"])
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote {len(rows)} puzzles to {args.output}")
+
+
+if __name__ == "__main__":
+    main()